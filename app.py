@@ -1,31 +1,116 @@
 
+import hashlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING
+
 import streamlit as st
-import pandas as pd
 from password_tool.checker import PasswordChecker
 from password_tool.generator import PasswordGenerator, PasswordStrength
 
+# pandas is imported inside the pages that use it to keep cold start light
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Maximum number of entries kept in per-session history
+HISTORY_LIMIT = 100
+
+# Custom CSS for better styling
+CUSTOM_CSS = """
+    <style>
+    .metric-card {
+        background-color: #f0f2f6;
+        padding: 20px;
+        border-radius: 8px;
+        margin-bottom: 10px;
+    }
+    </style>
+"""
+
+# Checker strength levels, weakest first (category order for audit results)
+STRENGTH_LEVELS = ("VERY WEAK", "WEAK", "MEDIUM", "STRONG")
+
+# Strength level badges with emoji and color
+STRENGTH_BADGES = {
+    "VERY WEAK": "🔴 VERY WEAK",
+    "WEAK": "🟠 WEAK",
+    "MEDIUM": "🟡 MEDIUM",
+    "STRONG": "🟢 STRONG",
+}
+
+# Display labels for the checker's criteria keys (unknown keys are title-cased)
+CRITERIA_LABELS = {
+    "length": "Length",
+    "uppercase": "Uppercase",
+    "lowercase": "Lowercase",
+    "numbers": "Numbers",
+    "special_chars": "Special Chars",
+    "no_dictionary_words": "No Dictionary Words",
+    "no_keyboard_patterns": "No Keyboard Patterns",
+    "no_sequential_chars": "No Sequential Chars",
+}
+
+# (level, title, description, recommended length) for each generator strength level
+STRENGTH_TABLE = [
+    (level.value,
+     *PasswordGenerator.get_strength_description(level),
+     PasswordGenerator.get_recommended_length(level))
+    for level in PasswordStrength
+]
+
+
+@st.cache_resource
+def get_checker() -> PasswordChecker:
+    # Shared checker instance, loaded once per process instead of per session
+    return PasswordChecker()
+
+
+@st.cache_resource
+def get_generator() -> PasswordGenerator:
+    # Shared generator instance, stateless so it is safe across sessions
+    return PasswordGenerator()
+
+
+@st.cache_data(show_spinner=False, max_entries=1024)
+def check_password_cached(password: str) -> dict:
+    # Memoized check so reruns and repeated passwords skip re-analysis
+    return get_checker().check_password(password)
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def results_to_csv(records: tuple) -> bytes:
+    # Serialize audit rows (tuples of column/value pairs) to CSV once per result set
+    import pandas as pd
+    return pd.DataFrame([dict(r) for r in records]).to_csv(index=False).encode()
+
 
 def initialize_session_state():
-    # Initialize Streamlit session state variables
-    if 'checker' not in st.session_state:
-        st.session_state.checker = PasswordChecker()
-    if 'generator' not in st.session_state:
-        st.session_state.generator = PasswordGenerator()
-    if 'generated_passwords' not in st.session_state:
-        st.session_state.generated_passwords = []
-    if 'check_history' not in st.session_state:
-        st.session_state.check_history = []
+    # Initialize Streamlit session state variables (per-user data only)
+    st.session_state.setdefault('generated_passwords', deque(maxlen=HISTORY_LIMIT))
+    st.session_state.setdefault('check_history', deque(maxlen=HISTORY_LIMIT))
+    st.session_state.setdefault('generated_df', None)
+    st.session_state.setdefault('last_check_result', None)
+    st.session_state.setdefault('last_check_criteria', None)
+    st.session_state.setdefault('last_check_digest', None)
+
+
+def get_generated_df() -> "pd.DataFrame":
+    # Rebuild the history table only after passwords were added or cleared
+    import pandas as pd
+    if st.session_state.generated_df is None:
+        st.session_state.generated_df = pd.DataFrame(list(st.session_state.generated_passwords))
+    return st.session_state.generated_df
+
+
+def password_digest(password: str) -> bytes:
+    # Identifies which input a stored result belongs to without keeping the plaintext
+    return hashlib.sha256(password.encode('utf-8', 'surrogatepass')).digest()
 
 
 def format_strength_badge(strength: str) -> str:
     # Format strength level with emoji and color
-    badges = {
-        "VERY WEAK": "🔴 VERY WEAK",
-        "WEAK": "🟠 WEAK",
-        "MEDIUM": "🟡 MEDIUM",
-        "STRONG": "🟢 STRONG",
-    }
-    return badges.get(strength, strength)
+    return STRENGTH_BADGES.get(strength, strength)
 
 
 def render_password_checker():
@@ -46,7 +131,7 @@ def render_password_checker():
     
     if check_button and password_input:
         # Check password
-        result = st.session_state.checker.check_password(password_input)
+        result = check_password_cached(password_input)
         
         # Store in history
         st.session_state.check_history.append({
@@ -56,77 +141,96 @@ def render_password_checker():
             'entropy': result['entropy_bits']
         })
         
-        # Display results
-        st.divider()
-        
-        # Strength indicator
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Strength", format_strength_badge(result['overall_strength']))
-        
-        with col2:
-            st.metric("Score", f"{result['score']}/100")
-        
-        with col3:
-            st.metric("Entropy", f"{result['entropy_bits']} bits")
-        
-        with col4:
-            st.metric("Time to Crack", result['time_to_crack'])
-        
-        # Detailed feedback
-        st.subheader("📋 Detailed Analysis")
-        
-        # Criteria checklist
-        criteria_col1, criteria_col2 = st.columns(2)
-        
-        with criteria_col1:
-            st.write("**Security Criteria:**")
-            for criterion, status_dict in list(result['criteria'].items())[:4]:
-                status = "✅" if status_dict['status'] == "PASS" else "❌"
-                clean_name = criterion.replace('_', ' ').title()
-                st.write(f"{status} {clean_name}")
-        
-        with criteria_col2:
-            st.write("**Additional Checks:**")
-            for criterion, status_dict in list(result['criteria'].items())[4:]:
-                status = "✅" if status_dict['status'] == "PASS" else "❌"
-                clean_name = criterion.replace('_', ' ').title()
-                st.write(f"{status} {clean_name}")
-        
-        # Feedback sections
-        st.divider()
-        
-        if result['feedback']['positive']:
-            with st.expander("✨ Positive Feedback", expanded=True):
-                for point in result['feedback']['positive']:
-                    st.success(f"✓ {point}")
-        
-        if result['feedback']['negative']:
-            with st.expander("⚠️ Areas to Improve", expanded=True):
-                for point in result['feedback']['negative']:
-                    st.warning(f"✗ {point}")
-        
-        if result['feedback']['suggestions']:
-            with st.expander("💡 Suggestions", expanded=True):
-                for suggestion in result['feedback']['suggestions']:
-                    st.info(f"→ {suggestion}")
-        
-        # Recommendation
-        st.divider()
-        if result['overall_strength'] == "STRONG":
-            st.success("✅ This is a strong password! Use it with confidence.")
-        elif result['overall_strength'] == "MEDIUM":
-            st.warning("⚠️ This password is acceptable but could be improved.")
-        else:
-            st.error("❌ This password is weak. Please use a stronger password.")
+        # Keep the latest result and its criteria split so reruns render
+        # without re-checking or re-formatting
+        criteria = [
+            (CRITERIA_LABELS.get(criterion) or criterion.replace('_', ' ').title(),
+             status_dict['status'] == "PASS")
+            for criterion, status_dict in result['criteria'].items()
+        ]
+        st.session_state.last_check_result = result
+        st.session_state.last_check_criteria = (criteria[:4], criteria[4:])
+        st.session_state.last_check_digest = password_digest(password_input)
     
     elif check_button:
         st.warning("Please enter a password to check.")
+        return
+    
+    # Only show the stored result while the field still holds the password it was for
+    result = st.session_state.last_check_result
+    if result is None or st.session_state.last_check_digest != password_digest(password_input):
+        return
+    primary_criteria, additional_criteria = st.session_state.last_check_criteria
+    
+    # Display results
+    st.divider()
+    
+    # Strength indicator
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Strength", format_strength_badge(result['overall_strength']))
+    
+    with col2:
+        st.metric("Score", f"{result['score']}/100")
+    
+    with col3:
+        st.metric("Entropy", f"{result['entropy_bits']} bits")
+    
+    with col4:
+        st.metric("Time to Crack", result['time_to_crack'])
+    
+    # Detailed feedback
+    st.subheader("📋 Detailed Analysis")
+    
+    # Criteria checklist
+    criteria_col1, criteria_col2 = st.columns(2)
+    
+    with criteria_col1:
+        st.write("**Security Criteria:**")
+        for clean_name, passed in primary_criteria:
+            status = "✅" if passed else "❌"
+            st.write(f"{status} {clean_name}")
+    
+    with criteria_col2:
+        st.write("**Additional Checks:**")
+        for clean_name, passed in additional_criteria:
+            status = "✅" if passed else "❌"
+            st.write(f"{status} {clean_name}")
+    
+    # Feedback sections
+    st.divider()
+    
+    if result['feedback']['positive']:
+        with st.expander("✨ Positive Feedback", expanded=True):
+            for point in result['feedback']['positive']:
+                st.success(f"✓ {point}")
+    
+    if result['feedback']['negative']:
+        with st.expander("⚠️ Areas to Improve", expanded=True):
+            for point in result['feedback']['negative']:
+                st.warning(f"✗ {point}")
+    
+    if result['feedback']['suggestions']:
+        with st.expander("💡 Suggestions", expanded=True):
+            for suggestion in result['feedback']['suggestions']:
+                st.info(f"→ {suggestion}")
+    
+    # Recommendation
+    st.divider()
+    if result['overall_strength'] == "STRONG":
+        st.success("✅ This is a strong password! Use it with confidence.")
+    elif result['overall_strength'] == "MEDIUM":
+        st.warning("⚠️ This password is acceptable but could be improved.")
+    else:
+        st.error("❌ This password is weak. Please use a stronger password.")
 
 
+@st.fragment
 def render_password_generator():
     # Render password generator section
+    import pandas as pd
+    
     st.header("⚡ Password Generator")
     
     # Configuration columns
@@ -154,13 +258,14 @@ def render_password_generator():
     with col4:
         readable = st.checkbox("Readable", value=False, help="Easier to remember")
     
-    # Generate buttons
-    col1, col2, col3 = st.columns(3)
+    # Generate buttons on their own row, in the same 4-column grid as the
+    # configuration above (the last column is left as a spacer)
+    col1, col2, col3, _ = st.columns(4)
     
     with col1:
         if st.button("🔐 Generate", use_container_width=True):
             try:
-                pwd = st.session_state.generator.generate_password(
+                pwd = get_generator().generate_password(
                     length=length,
                     strength=PasswordStrength[strength],
                     include_special=include_special,
@@ -172,6 +277,7 @@ def render_password_generator():
                     'length': length,
                     'timestamp': pd.Timestamp.now()
                 })
+                st.session_state.generated_df = None
                 st.success("Password generated!")
             except Exception as e:
                 st.error(f"Error generating password: {e}")
@@ -180,25 +286,29 @@ def render_password_generator():
         if st.button("🔄 Generate Multiple", use_container_width=True):
             try:
                 count = st.number_input("How many?", min_value=1, max_value=10, value=5)
-                pwds = st.session_state.generator.generate_multiple(
+                pwds = get_generator().generate_multiple(
                     count=count,
                     length=length,
                     strength=PasswordStrength[strength]
                 )
+                # One timestamp for the whole batch, generated in the same call
+                now = pd.Timestamp.now()
                 for pwd in pwds:
                     st.session_state.generated_passwords.append({
                         'password': pwd,
                         'strength': strength,
                         'length': length,
-                        'timestamp': pd.Timestamp.now()
+                        'timestamp': now
                     })
+                st.session_state.generated_df = None
                 st.success(f"Generated {count} passwords!")
             except Exception as e:
                 st.error(f"Error: {e}")
     
     with col3:
         if st.button("🗑️ Clear History", use_container_width=True):
-            st.session_state.generated_passwords = []
+            st.session_state.generated_passwords.clear()
+            st.session_state.generated_df = None
             st.info("History cleared!")
     
     # Display strength info
@@ -208,10 +318,8 @@ def render_password_generator():
     
     with col1:
         st.write("**Strength Levels:**")
-        for strength_level in PasswordStrength:
-            title, desc = PasswordGenerator.get_strength_description(strength_level)
-            rec_length = PasswordGenerator.get_recommended_length(strength_level)
-            st.write(f"**{strength_level.value}**: {desc} ({rec_length}+ chars)")
+        for level, title, desc, rec_length in STRENGTH_TABLE:
+            st.write(f"**{level}**: {desc} ({rec_length}+ chars)")
     
     with col2:
         st.write("**Entropy Information:**")
@@ -233,8 +341,8 @@ def render_password_generator():
         st.divider()
         st.subheader("📋 Generated Passwords")
         
-        # Create DataFrame for display
-        df = pd.DataFrame(st.session_state.generated_passwords)
+        # Reuse the DataFrame from the last change to the history
+        df = get_generated_df()
         
         # Display as table
         st.dataframe(
@@ -250,11 +358,15 @@ def render_password_generator():
             st.caption("Use the button at the top-right corner of the code block to copy")
 
 
+@st.fragment
 def render_batch_audit():
     # Render batch password audit section
+    import pandas as pd
+    
     st.header("📊 Batch Password Audit")
     
-    st.write("Paste multiple passwords (one per line) to audit them all at once.")
+    st.write("Paste multiple passwords (one per line) to audit them all at once. "
+             "Duplicate entries are audited once.")
     
     passwords_input = st.text_area(
         "Enter passwords (one per line):",
@@ -264,42 +376,50 @@ def render_batch_audit():
     
     if st.button("🚀 Audit All Passwords"):
         if passwords_input.strip():
-            passwords = [p.strip() for p in passwords_input.split('\n') if p.strip()]
+            # Deduplicate while preserving order so repeated entries are checked once
+            lines = (p.strip() for p in passwords_input.splitlines())
+            passwords = list(dict.fromkeys(p for p in lines if p))
             
-            results = []
+            total = len(passwords)
+            results = [None] * total
             progress_bar = st.progress(0)
+            # Throttle progress updates to ~20 frontend messages per audit
+            step = max(1, total // 20)
             
-            for i, pwd in enumerate(passwords):
-                result = st.session_state.checker.check_password(pwd)
-                results.append({
-                    'Password': '***',
-                    'Strength': result['overall_strength'],
-                    'Score': result['score'],
-                    'Entropy': result['entropy_bits'],
-                    'Time to Crack': result['time_to_crack']
-                })
-                progress_bar.progress((i + 1) / len(passwords))
+            # Run checks across worker threads; map() still yields in input order
+            with ThreadPoolExecutor() as executor:
+                checked = executor.map(check_password_cached, passwords)
+                for i, result in enumerate(checked):
+                    results[i] = {
+                        'Password': '***',
+                        'Strength': result['overall_strength'],
+                        'Score': result['score'],
+                        'Entropy': result['entropy_bits'],
+                        'Time to Crack': result['time_to_crack']
+                    }
+                    if i % step == 0 or i == total - 1:
+                        progress_bar.progress((i + 1) / total)
             
             # Display results
             st.divider()
             st.subheader("📈 Audit Results")
             
             df = pd.DataFrame(results)
+            df['Strength'] = pd.Categorical(df['Strength'], categories=STRENGTH_LEVELS)
             st.dataframe(df, use_container_width=True, hide_index=True)
             
-            # Summary statistics
+            # Summary statistics (vectorized over the categorical column)
+            strength_counts = df['Strength'].value_counts()
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                strong_count = len([r for r in results if r['Strength'] == 'STRONG'])
-                st.metric("Strong", strong_count)
+                st.metric("Strong", int(strength_counts['STRONG']))
             
             with col2:
-                medium_count = len([r for r in results if r['Strength'] == 'MEDIUM'])
-                st.metric("Medium", medium_count)
+                st.metric("Medium", int(strength_counts['MEDIUM']))
             
             with col3:
-                weak_count = len([r for r in results if r['Strength'] in ['WEAK', 'VERY WEAK']])
+                weak_count = int(strength_counts['WEAK'] + strength_counts['VERY WEAK'])
                 st.metric("Weak", weak_count)
             
             with col4:
@@ -307,7 +427,7 @@ def render_batch_audit():
                 st.metric("Avg Score", f"{avg_score:.0f}/100")
             
             # Download results as CSV
-            csv = df.to_csv(index=False)
+            csv = results_to_csv(tuple(tuple(r.items()) for r in results))
             st.download_button(
                 label="📥 Download Results (CSV)",
                 data=csv,
@@ -407,16 +527,7 @@ def main():
     )
     
     # Custom CSS for better styling
-    st.markdown("""
-        <style>
-        .metric-card {
-            background-color: #f0f2f6;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 10px;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
     
     # Initialize session state
     initialize_session_state()
@@ -433,9 +544,11 @@ def main():
     # Sidebar 
     if st.session_state.check_history:
         st.sidebar.subheader("📊 Check History")
-        latest_checks = st.session_state.check_history[-5:]
-        for check in reversed(latest_checks):
-            st.sidebar.write(f"Score: {check['score']}/100 - {check['strength']}")
+        latest_checks = islice(reversed(st.session_state.check_history), 5)
+        # One markdown element for all entries instead of one write per entry
+        st.sidebar.markdown("\n".join(
+            f"- Score: {check['score']}/100 - {check['strength']}" for check in latest_checks
+        ))
     
     # Main content
     if page == "Check Password":
@@ -1,8 +1,112 @@
-
 import re
 import math
-from typing import Dict, List, Any
-from rapidfuzz import fuzz
+import bisect
+import string
+import hashlib
+import functools
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Any, Iterable, NamedTuple, Optional
+from rapidfuzz import fuzz, process
+
+
+# Leet speak substitutions applied in one translate pass (p@ssw0rd → password)
+_LEET_TABLE = str.maketrans({
+    # Numbers and symbols to letters
+    '@': 'a', '4': 'a', '^': 'a',      # @ and 4 = a
+    '3': 'e', '€': 'e',                # 3 = e
+    '8': 'b',                          # 8 = b
+    '9': 'g',                          # 9 = g
+    '1': 'i', '|': 'i', '!': 'i',    # 1, |, ! = i
+    '0': 'o',                          # 0 = o ('()' handled separately)
+    '5': 's', '$': 's',                # 5, $ = s
+    '7': 't', '+': 't',                # 7, + = t
+    '2': 'z',                          # 2 = z
+    '6': 'g',                          # 6 = g
+    '.': None, '-': None, '_': None, ' ': None,  # Remove spacing
+})
+
+# Number of recent check results each checker keeps
+_RECENT_RESULTS = 256
+
+# Passwords shorter than this are rated VERY WEAK without running the scorers
+_MIN_SCORED_LENGTH = 4
+
+# Score tables: a value below thresholds[i] gets scores[i], at or above the last gets scores[-1]
+_LENGTH_THRESHOLDS = (6, 8, 12, 16)
+_LENGTH_SCORES = (0, 20, 50, 75, 100)
+_ENTROPY_THRESHOLDS = (30, 50, 70)
+_ENTROPY_SCORES = (10, 50, 75, 100)
+
+# Natural-log constants for the time to crack estimate
+_LN2 = math.log(2)
+_LN10 = math.log(10)
+_LOG_MINUTE = math.log(60)
+_LOG_HOUR = math.log(3600)
+_LOG_DAY = math.log(86400)
+_LOG_MILLION = math.log(1_000_000)
+_LOG_FLOAT_MAX = math.log(1e308)
+
+# Character class sets and their bits in the class mask
+_UPPER_SET = frozenset(string.ascii_uppercase)
+_LOWER_SET = frozenset(string.ascii_lowercase)
+_DIGIT_SET = frozenset(string.digits)
+_SPECIAL_SET = frozenset('!@#$%^&*()_+-=[]{};:\'",.<>?/\\|`~')
+_UPPER_BIT = 8
+_LOWER_BIT = 4
+_DIGIT_BIT = 2
+_SPECIAL_BIT = 1
+
+# Precompiled patterns shared by all checks
+# Keyboard walks like 'qwerty', 'asdf', '12345' (matched against lowercased input)
+_KEYBOARD_RE = re.compile('|'.join([
+    r'qwert|werty|ertyu|rtyui|tyuio|yuiop',  # QWERTY row
+    r'asdfg|sdfgh|dfghj|fghjk|ghjkl',        # ASDF row
+    r'zxcvb|xcvbn|cvbnm',                     # ZXCV row
+    r'12345|23456|34567|45678|56789|67890',  # Number sequence
+    r'!@#\$%|\$%\^&',                         # Special char sequence
+]))
+
+# Common substitution patterns
+_COMMON_PATTERN_RE = re.compile('|'.join([
+    r'[Pp](?:ass|@ssw0rd)',  # pass, password, p@ssw0rd
+    r'[Qq]werty',
+    r'[Aa]dmin',
+    r'[Ll]etme[Ii]n',
+    r'[Ww]elcome',
+    r'[Ss]ecure',
+]))
+
+# Criteria reported by every result, in display order
+_CRITERIA_KEYS = (
+    "length", "uppercase", "lowercase", "numbers",
+    "special_chars", "no_dictionary_words",
+    "no_keyboard_patterns", "no_sequential_chars",
+)
+
+# Common weak password patterns
+_COMMON_WORDS = (
+    'password', 'admin', 'user', 'welcome', 'letmein', 'monkey',
+    'dragon', 'master', 'shadow', 'sunshine', 'starlight', 'trustno1',
+    'qwerty', 'admin123', 'pass123', 'password123'
+)
+
+# Whitespace left after leet normalization (same characters str.split() splits on)
+_WHITESPACE_RE = re.compile(r'\s')
+
+# Any substantial (4+ chars) common word as a substring, found in a single pass
+_COMMON_WORD_RE = re.compile('|'.join(
+    re.escape(word) for word in _COMMON_WORDS if len(word) >= 4
+))
+
+
+class _PasswordScan(NamedTuple):
+    # Per-password features gathered once and shared by the scorers
+    lower: str
+    mask: int
+    has_keyboard: bool
+    has_repeat: bool
+    has_sequential: bool
 
 
 class PasswordChecker:
@@ -18,26 +122,101 @@ class PasswordChecker:
     
     def __init__(self, common_passwords_file: str = "data/common_passwords.txt"):
         # Initialize checker with common passwords list
-        self.common_passwords = self._load_common_passwords(common_passwords_file)
+        # The file is parsed once per process; instances share the read-only structures
+        self.common_passwords, self.common_list, self._common_lengths = \
+            self._load_common_passwords(common_passwords_file)
+        # Recently evaluated passwords (a live meter re-checks on every keystroke).
+        # Per instance, so results always match this instance's corpus. Keyed on a
+        # SHA-256 digest so a shared checker never holds submitted plaintext
+        self._recent = OrderedDict()
+        self._recent_lock = threading.Lock()
+        # Entropy bits per character for each of the 16 class masks
+        self._bits_per_char = [self._charset_bits(mask) for mask in range(16)]
     
-    def _load_common_passwords(self, filepath: str) -> set:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_common_passwords(filepath: str) -> tuple:
+        # Returns (entries, entries sorted by length, their lengths)
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return set(line.strip().lower() for line in f)
+            # Read, decode and lowercase the whole file at once, then split it in C
+            # instead of iterating line objects
+            with open(filepath, 'rb') as f:
+                text = f.read().decode('utf-8').lower()
+            common = frozenset(map(str.strip, text.splitlines()))
         except FileNotFoundError:
             print(f"Warning: {filepath} not found. Common password check disabled.")
-            return set()
-    
-    def check_password(self, password: str) -> Dict[str, Any]:
-        if not password:
-            return self._weak_result("Password cannot be empty")
+            common = frozenset()
         
+        # Entries sorted by length for RapidFuzz batch scoring, so a length
+        # window can be sliced out with bisect
+        by_length = sorted(common, key=len)
+        lengths = [len(p) for p in by_length]
+        return common, by_length, lengths
+    
+    def check_password(self, password: str, *, include_feedback: bool = True) -> Dict[str, Any]:
+        # include_feedback=False skips building the feedback lists ('feedback' is None)
+        if not password or len(password) < _MIN_SCORED_LENGTH:
+            # Empty and ultra-short inputs are VERY WEAK whatever they contain,
+            # so skip the scorers (and the dictionary scan) entirely
+            reason = ("Password cannot be empty" if not password
+                      else "Password too short (use 12+ characters)")
+            result = self._weak_result(reason)
+            if not include_feedback:
+                result["feedback"] = None
+            return result
+        
+        # Hand out a copy so callers can't mutate the cached result
+        return self._copy_result(self._evaluate_cached(password, include_feedback))
+    
+    def _evaluate_cached(self, password: str, include_feedback: bool) -> Dict[str, Any]:
+        # LRU over the last _RECENT_RESULTS evaluations, keyed on the password's digest
+        key = (hashlib.sha256(password.encode('utf-8', 'surrogatepass')).digest(),
+               include_feedback)
+        with self._recent_lock:
+            result = self._recent.get(key)
+            if result is not None:
+                self._recent.move_to_end(key)
+                return result
+        
+        result = self._evaluate(password, include_feedback)
+        with self._recent_lock:
+            self._recent[key] = result
+            if len(self._recent) > _RECENT_RESULTS:
+                self._recent.popitem(last=False)
+        return result
+    
+    def check_many(self, passwords: Iterable[str], *,
+                   include_feedback: bool = False) -> List[Dict[str, Any]]:
+        """
+        Args:
+        1.    passwords: Passwords to audit
+        2.    include_feedback: Build the feedback lists for each result
+                                (off by default; bulk audits usually only need scores)
+        
+        Returns:
+            One result dict per password, in input order
+        """
+        # Each distinct password is evaluated once; repeats get their own copy
+        evaluated: Dict[str, Dict[str, Any]] = {}
+        results = []
+        for password in passwords:
+            if password in evaluated:
+                results.append(self._copy_result(evaluated[password]))
+            else:
+                evaluated[password] = result = self.check_password(
+                    password, include_feedback=include_feedback)
+                results.append(result)
+        return results
+    
+    def _evaluate(self, password: str, include_feedback: bool = True) -> Dict[str, Any]:
         # Calculate all criteria
+        scan = self._scan(password)
+        mask = scan.mask
         length_score = self._check_length(password)
-        diversity_score = self._check_character_diversity(password)
-        entropy = self._calculate_entropy(password)
-        pattern_score = self._check_patterns(password)
-        dictionary_score = self._check_dictionary(password)
+        diversity_score = self._check_character_diversity(password, mask)
+        entropy = self._calculate_entropy(password, mask)
+        pattern_score = self._check_patterns(password, scan)
+        dictionary_score = self._check_dictionary(password, scan)
         
         # Calculate weighted overall score (out of 100)
         overall_score = (
@@ -62,8 +241,10 @@ class PasswordChecker:
         time_to_crack = self._calculate_time_to_crack(entropy)
         
         # Generate feedback
-        feedback = self._generate_feedback(password, length_score, diversity_score, 
-                                          pattern_score, dictionary_score)
+        feedback = None
+        if include_feedback:
+            feedback = self._generate_feedback(password, length_score, diversity_score, 
+                                              pattern_score, dictionary_score, scan)
         
         return {
             "password": "***" if len(password) > 0 else "",
@@ -74,13 +255,13 @@ class PasswordChecker:
             "feedback": feedback,
             "criteria": {
                 "length": {"status": "PASS" if self._length_check(password) else "FAIL"},
-                "uppercase": {"status": "PASS" if self._has_uppercase(password) else "FAIL"},
-                "lowercase": {"status": "PASS" if self._has_lowercase(password) else "FAIL"},
-                "numbers": {"status": "PASS" if self._has_numbers(password) else "FAIL"},
-                "special_chars": {"status": "PASS" if self._has_special_chars(password) else "FAIL"},
+                "uppercase": {"status": "PASS" if mask & _UPPER_BIT else "FAIL"},
+                "lowercase": {"status": "PASS" if mask & _LOWER_BIT else "FAIL"},
+                "numbers": {"status": "PASS" if mask & _DIGIT_BIT else "FAIL"},
+                "special_chars": {"status": "PASS" if mask & _SPECIAL_BIT else "FAIL"},
                 "no_dictionary_words": {"status": "PASS" if dictionary_score > 50 else "FAIL"},
                 "no_keyboard_patterns": {"status": "PASS" if pattern_score > 70 else "FAIL"},
-                "no_sequential_chars": {"status": "PASS" if not self._has_sequential_chars(password) else "FAIL"},
+                "no_sequential_chars": {"status": "PASS" if not scan.has_sequential else "FAIL"},
             }
         }
     
@@ -92,109 +273,92 @@ class PasswordChecker:
     
     def _check_length(self, password: str) -> float:
         # Score based on password length (0-100)
-        length = len(password)
-        if length < 6:
-            return 0
-        elif length < 8:
-            return 20
-        elif length < 12:
-            return 50
-        elif length < 16:
-            return 75
-        else:
-            return 100
+        # <6: 0, 6-7: 20, 8-11: 50, 12-15: 75, 16+: 100
+        return _LENGTH_SCORES[bisect.bisect_right(_LENGTH_THRESHOLDS, len(password))]
     
     # ==================== CHARACTER DIVERSITY ====================
     
     def _has_uppercase(self, password: str) -> bool:
         # Check for uppercase letters
-        return any(c.isupper() for c in password)
+        return not _UPPER_SET.isdisjoint(password)
     
     def _has_lowercase(self, password: str) -> bool:
         # Check for lowercase letters
-        return any(c.islower() for c in password)
+        return not _LOWER_SET.isdisjoint(password)
     
     def _has_numbers(self, password: str) -> bool:
         # Check for digits
-        return any(c.isdigit() for c in password)
+        return not _DIGIT_SET.isdisjoint(password)
     
     def _has_special_chars(self, password: str) -> bool:
         # Check for special characters
-        special = re.compile(r'[!@#$%^&*()_+\-=\[\]{};:\'",.<>?/\\|`~]')
-        return bool(special.search(password))
+        return not _SPECIAL_SET.isdisjoint(password)
+    
+    def _class_mask(self, password: Iterable[str]) -> int:
+        # Bitmask of the character classes present, from a single set() of the password
+        # (also accepts an iterable of its unique characters)
+        chars = set(password)
+        return ((_UPPER_BIT if not chars.isdisjoint(_UPPER_SET) else 0) |
+                (_LOWER_BIT if not chars.isdisjoint(_LOWER_SET) else 0) |
+                (_DIGIT_BIT if not chars.isdisjoint(_DIGIT_SET) else 0) |
+                (_SPECIAL_BIT if not chars.isdisjoint(_SPECIAL_SET) else 0))
     
-    def _check_character_diversity(self, password: str) -> float:
+    def _check_character_diversity(self, password: str, mask: Optional[int] = None) -> float:
         # Score based on character variety (0-100)
-        diversity_count = 0
-        
-        if self._has_uppercase(password):
-            diversity_count += 1
-        if self._has_lowercase(password):
-            diversity_count += 1
-        if self._has_numbers(password):
-            diversity_count += 1
-        if self._has_special_chars(password):
-            diversity_count += 1
-        
         # Score: 1 type = 25, 2 types = 50, 3 types = 75, 4 types = 100
-        return (diversity_count / 4) * 100
+        # Reuses the class mask from check_password when supplied
+        if mask is None:
+            mask = self._class_mask(password)
+        return (bin(mask).count('1') / 4) * 100
     
     # ==================== PATTERN DETECTION ====================
     
     def _has_keyboard_pattern(self, password: str) -> bool:
         # Detect keyboard walks like 'qwerty', 'asdf', '12345'
-        patterns = [
-            r'qwert|werty|ertyu|rtyui|tyuio|yuiop',  # QWERTY row
-            r'asdfg|sdfgh|dfghj|fghjk|ghjkl',        # ASDF row
-            r'zxcvb|xcvbn|cvbnm',                     # ZXCV row
-            r'12345|23456|34567|45678|56789|67890',  # Number sequence
-            r'!@#\$%|\$%\^&',                         # Special char sequence
-        ]
-        
-        pwd_lower = password.lower()
-        for pattern in patterns:
-            if re.search(pattern, pwd_lower):
-                return True
-        return False
+        return bool(_KEYBOARD_RE.search(password.lower()))
     
     def _has_sequential_chars(self, password: str) -> bool:
         # Detect sequential characters like 'abc', 'xyz', '012'
-        for i in range(len(password) - 2):
-            if ord(password[i+1]) == ord(password[i]) + 1 and \
-               ord(password[i+2]) == ord(password[i+1]) + 1:
+        # Convert to code points once instead of calling ord() per comparison
+        codes = list(map(ord, password))
+        for a, b, c in zip(codes, codes[1:], codes[2:]):
+            if b == a + 1 and c == b + 1:
                 return True
         return False
     
     def _has_repeated_chars(self, password: str) -> bool:
-        # Detect repeated characters like 'aaa', '1111'
-        return any(password.count(c) >= 3 for c in set(password))
+        # Detect repeated characters like 'aaa', '1111' (one Counter pass)
+        return max(Counter(password).values(), default=0) >= 3
     
     def _is_common_pattern(self, password: str) -> bool:
         # Detect common substitution patterns
-        common_patterns = [
-            r'[Pp]ass(word)?',
-            r'[Pp]\@ssw0rd',
-            r'[Qq]werty',
-            r'[Aa]dmin',
-            r'[Ll]etme[Ii]n',
-            r'[Ww]elcome',
-            r'[Ss]ecure',
-        ]
-        
-        for pattern in common_patterns:
-            if re.search(pattern, password):
-                return True
-        return False
+        return bool(_COMMON_PATTERN_RE.search(password))
+    
+    def _scan(self, password: str) -> _PasswordScan:
+        # Gather the lowercased text, class mask and pattern flags in one place
+        # so the scorers and the feedback don't each walk the password again
+        # (one Counter pass feeds both the class mask and the repeat flag)
+        counts = Counter(password)
+        lower = password.lower()
+        return _PasswordScan(
+            lower=lower,
+            mask=self._class_mask(counts),
+            has_keyboard=bool(_KEYBOARD_RE.search(lower)),
+            has_repeat=max(counts.values(), default=0) >= 3,
+            has_sequential=self._has_sequential_chars(password),
+        )
     
-    def _check_patterns(self, password: str) -> float:
+    def _check_patterns(self, password: str, scan: Optional[_PasswordScan] = None) -> float:
         # Score based on pattern detection (0-100). Higher is better.
+        if scan is None:
+            scan = self._scan(password)
         score = 100
         
-        if self._has_keyboard_pattern(password):
+        if scan.has_keyboard:
             score -= 25
-        if self._has_sequential_chars(password):
+        if scan.has_sequential:
             score -= 15
-        if self._has_repeated_chars(password):
+        if scan.has_repeat:
             score -= 10
         if self._is_common_pattern(password):
             score -= 20
@@ -203,11 +367,11 @@ class PasswordChecker:
     
     # ==================== DICTIONARY CHECK ====================
     
-    def _check_dictionary(self, password: str) -> float:
+    def _check_dictionary(self, password: str, scan: Optional[_PasswordScan] = None) -> float:
         # Enhanced dictionary check using fuzzy matching with RapidFuzz
         # Catches exact matches, variations, leet speak, typos, and phonetic similarities
         # Returns 0-100 score (higher = better, not in list)
-        pwd_lower = password.lower()
+        pwd_lower = scan.lower if scan is not None else password.lower()
         
         # Normalize leet speak variations (p@ssw0rd → password)
         normalized_pwd = self._normalize_leet_speak(pwd_lower)
@@ -217,128 +381,137 @@ class PasswordChecker:
             return 0  # FAIL - Password is directly in breach database
         
         # Fuzzy match
-        # Check for very similar passwords (85%+ similarity)
-        for common in self.common_passwords:
-            # Use token_set_ratio for order-independent comparison
-            similarity = fuzz.token_set_ratio(normalized_pwd, common)
-            
-            if similarity >= 85:  # 85%+ means very similar
-                # Return score inversely proportional to similarity
-                # 85% similar → 30 points, 90% similar → 10 points
-                return max(0, 50 - (similarity - 85) * 4)
-        
-        # Common weak password patterns
-        common_words = [
-            'password', 'admin', 'user', 'welcome', 'letmein', 'monkey',
-            'dragon', 'master', 'shadow', 'sunshine', 'starlight', 'trustno1',
-            'qwerty', 'admin123', 'pass123', 'password123'
-        ]
-        
-        for word in common_words:
-            similarity = fuzz.token_set_ratio(normalized_pwd, word)
-            
-            if similarity >= 80:  # 80%+ means contains dictionary word
-                # Higher similarity = worse score
-                # 80% match → 40 points, 95% match → 5 points
-                return max(10, 60 - (similarity - 80) * 2.5)
-        
-        # Check if password contains common words as substrings
-        for word in common_words:
-            if len(word) >= 4:  # Only check substantial words
-                if word in normalized_pwd:
-                    return 25  # Contains common word
+        # Check for very similar passwords (85%+ similarity) in a single C-level scan
+        # Normalization only deletes ASCII spaces, so tabs and other whitespace can
+        # still split the password into words. Those inputs keep the order-independent
+        # token_set_ratio over the full list (a single word inside the password can
+        # match); everything else uses the plain ratio over the length window
+        if _WHITESPACE_RE.search(normalized_pwd):
+            scorer, candidates = fuzz.token_set_ratio, self.common_list
+        else:
+            scorer, candidates = fuzz.ratio, self._fuzzy_candidates(normalized_pwd)
+        hit = process.extractOne(normalized_pwd, candidates,
+                                 scorer=scorer,
+                                 processor=None, score_cutoff=85)
+        if hit is not None:  # 85%+ means very similar
+            similarity = hit[1]
+            # Return score inversely proportional to similarity
+            # 85% similar → 30 points, 90% similar → 10 points
+            return max(0, 50 - (similarity - 85) * 4)
+        
+        hit = process.extractOne(normalized_pwd, _COMMON_WORDS,
+                                 scorer=scorer,
+                                 processor=None, score_cutoff=80)
+        if hit is not None:  # 80%+ means contains dictionary word
+            similarity = hit[1]
+            # Higher similarity = worse score
+            # 80% match → 40 points, 95% match → 5 points
+            return max(10, 60 - (similarity - 80) * 2.5)
+        
+        # Check if password contains common words as substrings (one regex scan)
+        if _COMMON_WORD_RE.search(normalized_pwd):
+            return 25  # Contains common word
         
         # No match found
         return 100
     
+    def _fuzzy_candidates(self, normalized_pwd: str) -> List[str]:
+        # Narrow the common list to entries that can possibly score 85+
+        # For strings of lengths a and b, fuzz.ratio is at most
+        # 200 * min(a, b) / (a + b), so b must lie within [a * 17/23, a * 23/17]
+        length = len(normalized_pwd)
+        lo = bisect.bisect_left(self._common_lengths, math.floor(length * 17 / 23))
+        hi = bisect.bisect_right(self._common_lengths, math.ceil(length * 23 / 17))
+        return self.common_list[lo:hi]
+    
     def _normalize_leet_speak(self, password: str) -> str:
-        
-        leet_map = {
-            # Numbers and symbols to letters
-            '@': 'a', '4': 'a', '^': 'a',      # @ and 4 = a
-            '3': 'e', '€': 'e',                # 3 = e
-            '8': 'b',                          # 8 = b
-            '9': 'g',                          # 9 = g
-            '1': 'i', '|': 'i', '!': 'i',    # 1, |, ! = i
-            '0': 'o', '()': 'o',               # 0 = o
-            '5': 's', '$': 's',                # 5, $ = s
-            '7': 't', '+': 't',                # 7, + = t
-            '2': 'z',                          # 2 = z
-            '6': 'g',                          # 6 = g
-            '.': '', '-': '', '_': '', ' ': '', # Remove spacing
-        }
-        
-        normalized = password
-        for leet_char, letter in leet_map.items():
-            normalized = normalized.replace(leet_char, letter)
-        
-        return normalized
+        # '()' is the only multi-character substitution; everything else is one
+        # str.translate pass
+        return password.replace('()', 'o').translate(_LEET_TABLE)
     
     # ==================== ENTROPY CALCULATION ====================
     
-    def _calculate_entropy(self, password: str) -> float:
-        # Calculate Shannon entropy of password
-        # Formula: log2(possible_characters ^ password_length)
-        # Industry standard: 50+ bits acceptable, 70+ bits strong
+    def _charset_bits(self, mask: int) -> float:
+        # log2 of the charset size implied by a class mask (0 if no class is present)
         charset_size = 0
         
-        if re.search(r'[a-z]', password):
+        if mask & _LOWER_BIT:
             charset_size += self.LOWERCASE
-        if re.search(r'[A-Z]', password):
+        if mask & _UPPER_BIT:
             charset_size += self.UPPERCASE
-        if re.search(r'[0-9]', password):
+        if mask & _DIGIT_BIT:
             charset_size += self.DIGITS
-        if re.search(r'[!@#$%^&*()_+\-=\[\]{};:\'",.<>?/\\|`~]', password):
+        if mask & _SPECIAL_BIT:
             charset_size += self.SPECIAL
         
         if charset_size == 0:
             return 0
-        
-        entropy = len(password) * math.log2(charset_size)
-        return entropy
+        return math.log2(charset_size)
+    
+    def _calculate_entropy(self, password: str, mask: Optional[int] = None) -> float:
+        # Calculate Shannon entropy of password
+        # Formula: log2(possible_characters ^ password_length)
+        # Industry standard: 50+ bits acceptable, 70+ bits strong
+        # Bits per character come from the per-mask table built in __init__
+        # (the mask is computed here if not supplied)
+        if mask is None:
+            mask = self._class_mask(password)
+        return len(password) * self._bits_per_char[mask]
     
     def _entropy_to_score(self, entropy: float) -> float:
         # Convert entropy bits to score (0-100)
-        if entropy < 30:
-            return 10
-        elif entropy < 50:
-            return 50
-        elif entropy < 70:
-            return 75
-        else:
-            return 100
+        # <30: 10, 30-49: 50, 50-69: 75, 70+: 100
+        return _ENTROPY_SCORES[bisect.bisect_right(_ENTROPY_THRESHOLDS, entropy)]
     
     # ==================== TIME TO CRACK ====================
     
     def _calculate_time_to_crack(self, entropy: float) -> str:
         # Calculate approximate time to crack (assuming 1 billion guesses/sec)
-        total_possibilities = 2 ** entropy
-        average_guesses = total_possibilities / 2  # On average, takes half the guesses
-        seconds = average_guesses / self.GUESSES_PER_SECOND
+        # Worked out in natural-log seconds so huge entropies never build 2**entropy;
+        # exp() only runs on the already-scaled value of the chosen unit
+        # On average an attacker needs half the guesses: log(2**entropy / 2)
+        log_seconds = (entropy - 1) * _LN2 - math.log(self.GUESSES_PER_SECOND)
+        log_year = math.log(self.SECONDS_PER_YEAR)
         
-        if seconds < 1:
+        if log_seconds < 0:
             return "Less than 1 second"
-        elif seconds < 60:
-            return f"{seconds:.1f} seconds"
-        elif seconds < 3600:
-            return f"{seconds/60:.1f} minutes"
-        elif seconds < 86400:
-            return f"{seconds/3600:.1f} hours"
-        elif seconds < self.SECONDS_PER_YEAR:
-            return f"{seconds/86400:.1f} days"
-        else:
-            years = seconds / self.SECONDS_PER_YEAR
-            if years > 1_000_000:
-                return f"~{years/1_000_000:.1f} million years"
-            else:
-                return f"~{years:.1f} years"
+        elif log_seconds < _LOG_MINUTE:
+            return f"{math.exp(log_seconds):.1f} seconds"
+        elif log_seconds < _LOG_HOUR:
+            return f"{math.exp(log_seconds - _LOG_MINUTE):.1f} minutes"
+        elif log_seconds < _LOG_DAY:
+            return f"{math.exp(log_seconds - _LOG_HOUR):.1f} hours"
+        elif log_seconds < log_year:
+            return f"{math.exp(log_seconds - _LOG_DAY):.1f} days"
+        
+        log_years = log_seconds - log_year
+        if log_years <= _LOG_MILLION:
+            return f"~{math.exp(log_years):.1f} years"
+        log_million_years = log_years - _LOG_MILLION
+        if log_million_years <= _LOG_MILLION:
+            return f"~{math.exp(log_million_years):.1f} million years"
+        if log_million_years < _LOG_FLOAT_MAX:
+            # Three significant digits; the exp() result isn't exact past ~15 digits anyway
+            return f"~{math.exp(log_million_years):.3g} million years"
+        # Beyond float range: split log10 into mantissa and exponent by hand
+        log10_value = log_million_years / _LN10
+        exponent = math.floor(log10_value)
+        mantissa = round(10 ** (log10_value - exponent), 2)
+        if mantissa >= 10:  # e.g. 9.999 rounded up
+            mantissa, exponent = mantissa / 10, exponent + 1
+        return f"~{mantissa:.3g}e+{exponent} million years"
     
     # ==================== FEEDBACK GENERATION ====================
     
     def _generate_feedback(self, password: str, length_score: float, 
                           diversity_score: float, pattern_score: float,
-                          dictionary_score: float) -> Dict[str, List[str]]:
+                          dictionary_score: float,
+                          scan: Optional[_PasswordScan] = None) -> Dict[str, List[str]]:
         # Generate actionable feedback for the user
+        # Class and keyboard checks come from the scan check_password already did
+        if scan is None:
+            scan = self._scan(password)
+        mask = scan.mask
         positive = []
         negative = []
         suggestions = []
@@ -365,23 +538,23 @@ class PasswordChecker:
             negative.append("Password too short (use 12+ characters)")
             suggestions.append("Increase password length to at least 12 characters")
         
-        if not self._has_uppercase(password):
+        if not mask & _UPPER_BIT:
             negative.append("Missing uppercase letters")
             suggestions.append("Add uppercase letters (A-Z)")
         
-        if not self._has_lowercase(password):
+        if not mask & _LOWER_BIT:
             negative.append("Missing lowercase letters")
             suggestions.append("Add lowercase letters (a-z)")
         
-        if not self._has_numbers(password):
+        if not mask & _DIGIT_BIT:
             negative.append("Missing numbers")
             suggestions.append("Add numbers (0-9)")
         
-        if not self._has_special_chars(password):
+        if not mask & _SPECIAL_BIT:
             negative.append("Missing special characters")
             suggestions.append("Add special characters (!@#$%^&*)")
         
-        if self._has_keyboard_pattern(password):
+        if scan.has_keyboard:
             negative.append("Contains keyboard walk pattern")
             suggestions.append("Avoid keyboard patterns like qwerty or 12345")
         
@@ -411,11 +584,17 @@ class PasswordChecker:
                 "negative": [reason],
                 "suggestions": ["Create a proper password with minimum 12 characters"]
             },
-            "criteria": {k: {"status": "FAIL"} for k in [
-                "length", "uppercase", "lowercase", "numbers", 
-                "special_chars", "no_dictionary_words", 
-                "no_keyboard_patterns", "no_sequential_chars"
-            ]}
+            "criteria": {k: {"status": "FAIL"} for k in _CRITERIA_KEYS}
         }
+    
+    @staticmethod
+    def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        # Copy the mutable parts of a result (feedback lists, criteria dicts);
+        # knowing the shape makes this several times cheaper than copy.deepcopy
+        copied = dict(result)
+        if result["feedback"] is not None:
+            copied["feedback"] = {k: list(v) for k, v in result["feedback"].items()}
+        copied["criteria"] = {k: dict(v) for k, v in result["criteria"].items()}
+        return copied
 
 
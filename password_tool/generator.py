@@ -23,10 +23,21 @@ class PasswordGenerator:
     
     # Ambiguous characters to exclude (optional)
     AMBIGUOUS = "0O1lI|`"  # Often confused: zero/O, one/l/I
+    _AMBIGUOUS_TABLE = str.maketrans('', '', AMBIGUOUS)  # Deletes them in one translate()
     
     def __init__(self):
         # Initialize the generator
-        pass
+        self._rng = secrets.SystemRandom()
+        # Precompute the fill charset for every (include_special, exclude_ambiguous) pair
+        self._charsets = {}
+        for include_special in (False, True):
+            for exclude_ambiguous in (False, True):
+                charset = self.LOWERCASE + self.UPPERCASE + self.DIGITS
+                if include_special:
+                    charset += self.SPECIAL
+                if exclude_ambiguous:
+                    charset = self._remove_ambiguous(charset)
+                self._charsets[(include_special, exclude_ambiguous)] = charset
     
     # ==================== STRENGTH LEVEL GENERATORS ====================
     
@@ -53,105 +64,45 @@ class PasswordGenerator:
         if readable:
             return self._generate_readable_password(length, include_special)
         
-        # Map strength to actual strategy
+        pools = self._required_pools(strength, include_special)
+        charset = self._fill_charset(strength, include_special, exclude_ambiguous)
+        fill = self._batch_choice(charset, length - len(pools))
+        return self._assemble(pools, fill)
+    
+    def _required_pools(self, strength: PasswordStrength, include_special: bool) -> List[str]:
+        # Character pools that each contribute one guaranteed character
         if strength == PasswordStrength.WEAK:
-            return self._generate_weak(length)
+            # WEAK: letters and numbers only, no guarantees
+            return []
         elif strength == PasswordStrength.MEDIUM:
-            return self._generate_medium(length, include_special, exclude_ambiguous)
+            # MEDIUM: guaranteed 1 uppercase, 1 lowercase, 1 digit (+1 special if requested)
+            pools = [self.UPPERCASE, self.LOWERCASE, self.DIGITS]
+            if include_special and len(self.SPECIAL) > 0:
+                pools.append(self.SPECIAL)
+            return pools
         elif strength == PasswordStrength.STRONG:
-            return self._generate_strong(length, include_special, exclude_ambiguous)
+            # STRONG: guaranteed uppercase, lowercase, digit, and special char
+            return [self.UPPERCASE, self.LOWERCASE, self.DIGITS, self.SPECIAL]
         else:  # VERY_STRONG
-            return self._generate_very_strong(length, exclude_ambiguous)
-    
-    def _generate_weak(self, length: int) -> str:
-        # Generate WEAK password: letters and numbers only
-        charset = self.LOWERCASE + self.UPPERCASE + self.DIGITS
-        password = ''.join(secrets.choice(charset) for _ in range(length))
-        return password
+            # VERY_STRONG: at least 2 of each character type for maximum diversity
+            return [self.UPPERCASE, self.UPPERCASE, self.LOWERCASE, self.LOWERCASE,
+                    self.DIGITS, self.DIGITS, self.SPECIAL, self.SPECIAL]
     
-    def _generate_medium(self, length: int, include_special: bool, 
-                        exclude_ambiguous: bool) -> str:
-        #Generate MEDIUM password: guaranteed 1 uppercase, 1 lowercase, 1 digit
-        charset = self.LOWERCASE + self.UPPERCASE + self.DIGITS
-        if include_special:
-            charset += self.SPECIAL
-        
-        if exclude_ambiguous:
-            charset = self._remove_ambiguous(charset)
-        
-        # Guarantee minimum requirements
-        required = [
-            secrets.choice(self.UPPERCASE),
-            secrets.choice(self.LOWERCASE),
-            secrets.choice(self.DIGITS),
-        ]
-        
-        if include_special and len(self.SPECIAL) > 0:
-            required.append(secrets.choice(self.SPECIAL))
-        
-        # Fill remaining length with random characters
-        remaining = length - len(required)
-        password_chars = required + [secrets.choice(charset) for _ in range(remaining)]
-        
-        # Shuffle to avoid predictable patterns
-        password_chars = self._shuffle_list(password_chars)
-        
-        return ''.join(password_chars)
-    
-    def _generate_strong(self, length: int, include_special: bool,
-                        exclude_ambiguous: bool) -> str:
-        # Generate STRONG password: guaranteed uppercase, lowercase, digit, and special char
-        
-        charset = self.LOWERCASE + self.UPPERCASE + self.DIGITS + self.SPECIAL
-        
-        if exclude_ambiguous:
-            charset = self._remove_ambiguous(charset)
-        
-        # Guarantee all 4 character types
-        required = [
-            secrets.choice(self.UPPERCASE),
-            secrets.choice(self.LOWERCASE),
-            secrets.choice(self.DIGITS),
-            secrets.choice(self.SPECIAL),
-        ]
-        
-        # Fill remaining length
-        remaining = length - len(required)
-        password_chars = required + [secrets.choice(charset) for _ in range(remaining)]
-        
-        # Shuffle
-        password_chars = self._shuffle_list(password_chars)
-        
-        return ''.join(password_chars)
+    def _fill_charset(self, strength: PasswordStrength, include_special: bool,
+                      exclude_ambiguous: bool) -> str:
+        # Charset used for the non-guaranteed positions
+        if strength == PasswordStrength.WEAK:
+            return self._charsets[(False, False)]
+        elif strength == PasswordStrength.MEDIUM:
+            return self._charsets[(include_special, exclude_ambiguous)]
+        else:  # STRONG and VERY_STRONG always include special characters
+            return self._charsets[(True, exclude_ambiguous)]
     
-    def _generate_very_strong(self, length: int, exclude_ambiguous: bool) -> str:
-        # Generate VERY_STRONG password: maximum character diversity
-        # Includes uppercase, lowercase, digits, and special characters
-
-        charset = self.LOWERCASE + self.UPPERCASE + self.DIGITS + self.SPECIAL
-        
-        if exclude_ambiguous:
-            charset = self._remove_ambiguous(charset)
-        
-        # Guarantee at least 2 of each character type for maximum diversity
-        required = [
-            secrets.choice(self.UPPERCASE),
-            secrets.choice(self.UPPERCASE),
-            secrets.choice(self.LOWERCASE),
-            secrets.choice(self.LOWERCASE),
-            secrets.choice(self.DIGITS),
-            secrets.choice(self.DIGITS),
-            secrets.choice(self.SPECIAL),
-            secrets.choice(self.SPECIAL),
-        ]
-        
-        # Fill remaining length
-        remaining = length - len(required)
-        password_chars = required + [secrets.choice(charset) for _ in range(remaining)]
-        
-        # Shuffle
-        password_chars = self._shuffle_list(password_chars)
-        
+    def _assemble(self, pools: List[str], fill: List[str]) -> str:
+        # Combine one character from each required pool with the fill, then shuffle
+        # to avoid predictable patterns
+        password_chars = [secrets.choice(pool) for pool in pools] + fill
+        self._rng.shuffle(password_chars)
         return ''.join(password_chars)
     
     def _generate_readable_password(self, length: int, include_special: bool) -> str:
@@ -186,15 +137,23 @@ class PasswordGenerator:
     
     def _remove_ambiguous(self, charset: str) -> str:
         # Remove ambiguous characters from charset
-        return ''.join(c for c in charset if c not in self.AMBIGUOUS)
+        return charset.translate(self._AMBIGUOUS_TABLE)
+    
+    def _batch_choice(self, charset: str, count: int) -> List[str]:
+        # Pick count characters uniformly from charset with one token_bytes() draw
+        # per round; bytes at or above the largest multiple of len(charset) are
+        # rejected so that the modulo does not bias towards the first characters
+        size = len(charset)
+        limit = 256 - (256 % size)
+        chars: List[str] = []
+        while len(chars) < count:
+            chars.extend(charset[b % size] for b in secrets.token_bytes(count * 2) if b < limit)
+        return chars[:count]
     
     def _shuffle_list(self, items: List[str]) -> List[str]:
-        # Shuffle a list using cryptographic randomness
+        # Shuffle a copy of a list using cryptographic randomness
         shuffled = items.copy()
-        n = len(shuffled)
-        for i in range(n - 1, 0, -1):
-            j = secrets.randbelow(i + 1)
-            shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
+        self._rng.shuffle(shuffled)
         return shuffled
     
     # ==================== BATCH OPERATIONS ====================
@@ -210,7 +169,17 @@ class PasswordGenerator:
         Returns:
             List of generated passwords
         """
-        return [self.generate_password(length, strength) for _ in range(count)]
+        if length < 8:
+            raise ValueError("Password length must be at least 8 characters")
+        
+        # Draw the fill characters for the whole batch at once, then hand
+        # each password its own slice
+        pools = self._required_pools(strength, include_special=True)
+        charset = self._fill_charset(strength, include_special=True, exclude_ambiguous=True)
+        remaining = length - len(pools)
+        fill = self._batch_choice(charset, count * remaining)
+        return [self._assemble(pools, fill[i * remaining:(i + 1) * remaining])
+                for i in range(count)]
     
     # ==================== PASSWORD STRENGTH RECOMMENDATION ====================
     
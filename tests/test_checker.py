@@ -17,6 +17,11 @@ class TestPasswordChecker:
         assert checker is not None
         assert hasattr(checker, 'common_passwords')
     
+    def test_common_passwords_loaded_once(self, checker):
+        """Test that checkers share one parsed common password list"""
+        other = PasswordChecker()
+        assert other.common_passwords is checker.common_passwords
+    
     def test_check_password_returns_dict(self, checker):
         """Test that check_password returns a dictionary"""
         result = checker.check_password("TestPassword123!")
@@ -26,6 +31,21 @@ class TestPasswordChecker:
         assert 'entropy_bits' in result
         assert 'feedback' in result
     
+    def test_repeated_check_returns_independent_copy(self, checker):
+        """Test that mutating a result doesn't leak into later checks of the same password"""
+        first = checker.check_password("TestPassword123!")
+        first['feedback']['positive'].clear()
+        first['score'] = -1
+        second = checker.check_password("TestPassword123!")
+        assert second['score'] != -1
+        assert second['feedback']['positive']
+    
+    def test_result_cache_does_not_keep_plaintext(self, checker):
+        """Test that memoized results are keyed on a digest, not the password itself"""
+        checker.check_password("Tr0pic@lThund3rstorm!")
+        for key in checker._recent:
+            assert "Tr0pic@lThund3rstorm!" not in key
+    
     # ==================== STRENGTH LEVELS ====================
     
     def test_very_weak_password(self, checker):
@@ -33,6 +53,15 @@ class TestPasswordChecker:
         result = checker.check_password("")
         assert result['overall_strength'] == "VERY WEAK"
         assert result['score'] == 0
+        assert checker.check_password(None)['overall_strength'] == "VERY WEAK"
+    
+    def test_ultra_short_password_short_circuits(self, checker):
+        """Test that passwords under 4 characters are VERY WEAK regardless of content"""
+        result = checker.check_password("Z9!")
+        assert result['overall_strength'] == "VERY WEAK"
+        assert result['score'] == 0
+        assert len(result['criteria']) == 8
+        assert all(c['status'] == "FAIL" for c in result['criteria'].values())
     
     def test_weak_password_detection(self, checker):
         """Test detection of weak passwords"""
@@ -128,6 +157,17 @@ class TestPasswordChecker:
         assert checker._has_sequential_chars("xyz") is True
         assert checker._has_sequential_chars("abd") is False
     
+    def test_sequential_char_detection_long_password(self, checker):
+        """Test sequential detection at the end of a long password"""
+        assert checker._has_sequential_chars("Zq!" * 10 + "xyz") is True
+        assert checker._has_sequential_chars("Zq!" * 10 + "xzy") is False
+    
+    def test_lone_surrogate_password(self, checker):
+        """Test that strings with unpaired surrogates are scored instead of raising"""
+        assert checker._has_sequential_chars("a\ud800" * 15) is False
+        result = checker.check_password("a\ud800" * 15)
+        assert 0 <= result['score'] <= 100
+    
     def test_repeated_char_detection(self, checker):
         """Test detection of repeated characters"""
         assert checker._has_repeated_chars("aaa") is True
@@ -200,6 +240,12 @@ class TestPasswordChecker:
         time2 = checker._calculate_time_to_crack(70)
         assert "year" in time2.lower() or "million" in time2.lower()
     
+    def test_time_to_crack_huge_entropy(self, checker):
+        """Test that very high entropy doesn't overflow the estimate"""
+        assert "million years" in checker._calculate_time_to_crack(5000)
+        # Huge estimates are shown with a few significant digits, not noise digits
+        assert checker._calculate_time_to_crack(140) == "~2.21e+19 million years"
+    
     # ==================== FEEDBACK GENERATION ====================
     
     def test_feedback_structure(self, checker):
@@ -254,6 +300,24 @@ class TestPasswordChecker:
         assert strong['score'] > weak['score']
         assert strong['entropy_bits'] > weak['entropy_bits']
     
+    def test_check_many_matches_single_checks(self, checker):
+        """Test that batch checking returns one independent result per input, in order"""
+        passwords = ["password", "Tr0pic@lThund3rstorm!", "password"]
+        results = checker.check_many(passwords)
+        
+        assert [r['score'] for r in results] == \
+            [checker.check_password(p)['score'] for p in passwords]
+        assert results[0] is not results[2]
+    
+    def test_check_password_without_feedback(self, checker):
+        """Test that feedback can be skipped without changing the score"""
+        full = checker.check_password("Password123")
+        bare = checker.check_password("Password123", include_feedback=False)
+        
+        assert bare['feedback'] is None
+        assert bare['score'] == full['score']
+        assert bare['criteria'] == full['criteria']
+    
     def test_edge_cases(self, checker):
         """Test edge cases"""
         # Very long password
@@ -285,6 +349,17 @@ class TestPasswordCheckerDictionary:
         """Test that non-dictionary words score higher"""
         result = checker._check_dictionary("Xyzzyx123")
         assert result > 80
+    
+    def test_whitespace_separated_words_are_matched(self, checker):
+        """Test that tab- or line-separated common words are still caught"""
+        assert checker._check_dictionary("correct\thorse\tbattery") < 50
+        assert checker._check_dictionary("\u2028abc\u2028") < 50
+    
+    def test_fuzzy_candidates_length_window(self, checker):
+        """Test that fuzzy candidates are limited to lengths that can score 85+"""
+        candidates = checker._fuzzy_candidates("abcdefghij")
+        assert len(candidates) > 0
+        assert all(7 <= len(c) <= 14 for c in candidates)
 
 
 if __name__ == "__main__":
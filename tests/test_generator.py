@@ -223,6 +223,14 @@ class TestPasswordGenerator:
         for char in PasswordGenerator.AMBIGUOUS:
             assert char not in charset
     
+    def test_batch_choice_draws_from_charset(self, generator):
+        """Test that batched sampling returns the requested count from the charset"""
+        chars = generator._batch_choice("abc", 100)
+        
+        assert len(chars) == 100
+        assert set(chars) <= set("abc")
+        assert generator._batch_choice("abc", 0) == []
+    
     def test_shuffle_list_changes_order(self, generator):
         """Test that shuffle actually changes the order"""
         items = list("abcdefghij")